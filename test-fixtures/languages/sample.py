@@ -1,6 +1,7 @@
 """Test fixture for Python code"""
 from typing import Dict, List, Optional, Callable
-import math
+
+import numpy as np
 
 
 class DataProcessor:
@@ -13,16 +14,31 @@ class DataProcessor:
             name: The name of the processor
         """
         self.name = name
-        self.data: List[float] = []
+        self._buf: np.ndarray = np.empty(16, dtype=np.float64)
+        self._n: int = 0
         self.filters: Dict[str, Callable] = {}
 
+    @property
+    def data(self) -> np.ndarray:
+        """A view of the stored data points (no copy)."""
+        return self._buf[:self._n]
+
     def add_data(self, value: float) -> None:
         """Add a single data point.
 
         Args:
             value: The value to add
         """
-        self.data.append(value)
+        if self._n == self._buf.size:
+            grown = np.empty(self._buf.size * 2, dtype=np.float64)
+            grown[:self._n] = self._buf
+            self._buf = grown
+        self._buf[self._n] = value
+        self._n += 1
+
+    def _as_array(self) -> np.ndarray:
+        """Return the data as a NumPy array."""
+        return self._buf[:self._n]
 
     def calculate_mean(self) -> Optional[float]:
         """Calculate the mean of the data.
@@ -30,9 +46,9 @@ class DataProcessor:
         Returns:
             The mean value or None if no data
         """
-        if not self.data:
+        if self._n == 0:
             return None
-        return sum(self.data) / len(self.data)
+        return float(self._as_array().mean())
 
     def calculate_median(self) -> Optional[float]:
         """Calculate the median of the data.
@@ -40,17 +56,27 @@ class DataProcessor:
         Returns:
             The median value or None if no data
         """
-        if not self.data:
+        if self._n == 0:
             return None
-        sorted_data = sorted(self.data)
-        n = len(sorted_data)
-        if n % 2 == 0:
-            return (sorted_data[n//2 - 1] + sorted_data[n//2]) / 2
-        return sorted_data[n//2]
+        return float(np.median(self._as_array()))
+
+    def register_ufilter(self, name: str, func: Callable) -> None:
+        """Register a filter, vectorizing plain scalar callables.
+
+        Args:
+            name: The name to register the filter under
+            func: A ufunc, array-aware callable, or scalar callable
+        """
+        if not isinstance(func, np.ufunc):
+            func = np.frompyfunc(func, 1, 1)
+        self.filters[name] = func
 
     def apply_filter(self, filter_name: str) -> List[float]:
         """Apply a named filter to the data.
 
+        The filter is called once with the whole data array, so filters
+        should be ufuncs or array-aware callables (see register_ufilter).
+
         Args:
             filter_name: The name of the filter to apply
 
@@ -58,8 +84,8 @@ class DataProcessor:
             The filtered data
         """
         if filter_name not in self.filters:
-            return self.data
-        return [self.filters[filter_name](x) for x in self.data]
+            return list(self.data)
+        return list(self.filters[filter_name](self._as_array()))
 
     @staticmethod
     def standard_deviation(data: List[float]) -> float:
@@ -71,11 +97,10 @@ class DataProcessor:
         Returns:
             The standard deviation
         """
-        if len(data) < 2:
+        arr = np.asarray(data, dtype=np.float64)
+        if arr.size < 2:
             return 0.0
-        mean = sum(data) / len(data)
-        variance = sum((x - mean) ** 2 for x in data) / (len(data) - 1)
-        return math.sqrt(variance)
+        return float(arr.std(ddof=1))
 
     @classmethod
     def from_csv(cls, filepath: str) -> 'DataProcessor':
@@ -103,10 +128,10 @@ def fibonacci(n: int) -> int:
     """
     if n <= 0:
         return 0
-    elif n == 1:
-        return 1
-    else:
-        return fibonacci(n - 1) + fibonacci(n - 2)
+    a, b = 0, 1
+    for _ in range(n - 1):
+        a, b = b, a + b
+    return b
 
 
 async def async_process_data(data: List[float]) -> Dict[str, float]:
@@ -122,15 +147,16 @@ async def async_process_data(data: List[float]) -> Dict[str, float]:
     import asyncio
     await asyncio.sleep(0.1)
 
+    arr = np.asarray(data, dtype=np.float64)
     return {
-        'min': min(data) if data else 0,
-        'max': max(data) if data else 0,
-        'sum': sum(data),
-        'count': len(data),
+        'min': float(arr.min()) if arr.size else 0,
+        'max': float(arr.max()) if arr.size else 0,
+        'sum': float(arr.sum()),
+        'count': int(arr.size),
     }
 
 
-# Lambda functions for testing
-square = lambda x: x ** 2
-cube = lambda x: x ** 3
+# Lambda functions for testing (array-aware, usable with apply_filter)
+square = np.square
+cube = lambda x: x * x * x
 is_even = lambda x: x % 2 == 0
@@ -3,6 +3,7 @@ Database connection and query operations
 """
 
 import sqlite3
+import numpy as np
 from typing import List, Dict, Any, Optional
 from contextlib import contextmanager
 
@@ -11,17 +12,26 @@ class DatabaseConnection:
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.connection = None
+        # SQLite is in-process, so the "pool" is one long-lived connection;
+        # opening and closing per query would dominate small-query latency
+        # cached_statements keeps compiled statements alive so repeated
+        # queries skip SQLite's parse/plan step
+        self.connection = sqlite3.connect(db_path, check_same_thread=False,
+                                          cached_statements=256)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._query_cache: Dict[tuple, str] = {}
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        try:
-            self.connection = sqlite3.connect(self.db_path)
-            yield self.connection
-        finally:
-            if self.connection:
-                self.connection.close()
+        """Context manager yielding the shared connection"""
+        yield self.connection
+
+    def close(self):
+        """Close the underlying connection"""
+        if self.connection:
+            self.connection.close()
+            self.connection = None
 
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute a SELECT query and return results as list of dicts"""
@@ -31,11 +41,45 @@ class DatabaseConnection:
             columns = [col[0] for col in cursor.description]
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
+    def execute_query_rows(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Execute a SELECT query and return sqlite3.Row results
+
+        Rows support access by column name or index without the cost of
+        building a dict per row.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def execute_query_columnar(self, query: str, params: tuple = ()) -> Dict[str, np.ndarray]:
+        """Execute a SELECT query and return results as column arrays
+
+        Builds one NumPy array per column instead of one dict per row,
+        which suits numeric result sets with many rows.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            columns = [col[0] for col in cursor.description]
+            rows = cursor.fetchall()
+            return {name: np.asarray([row[i] for row in rows])
+                    for i, name in enumerate(columns)}
+
+    def _insert_query(self, table: str, columns: tuple) -> str:
+        """Build (or fetch cached) INSERT statement text for a column set"""
+        key = ('insert', table, columns)
+        query = self._query_cache.get(key)
+        if query is None:
+            placeholders = ', '.join(['?' for _ in columns])
+            query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            self._query_cache[key] = query
+        return query
+
     def insert_record(self, table: str, data: Dict[str, Any]) -> int:
         """Insert a record into specified table"""
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data])
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        query = self._insert_query(table, tuple(data.keys()))
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -43,10 +87,31 @@ class DatabaseConnection:
             conn.commit()
             return cursor.lastrowid
 
+    def insert_records(self, table: str, rows: List[Dict[str, Any]]) -> int:
+        """Insert many records with one executemany in a single transaction
+
+        The whole batch pays one commit (one WAL fsync) instead of one per
+        row, trading the memory to hold the batch for bulk-load throughput.
+        """
+        if not rows:
+            return 0
+        columns = tuple(rows[0].keys())
+        query = self._insert_query(table, columns)
+
+        with self.get_connection() as conn:
+            with conn:
+                cursor = conn.cursor()
+                cursor.executemany(query, [tuple(row[c] for c in columns) for row in rows])
+            return cursor.rowcount
+
     def update_record(self, table: str, data: Dict[str, Any], where: str, where_params: tuple) -> int:
         """Update records in database table"""
-        set_clause = ', '.join([f"{k} = ?" for k in data.keys()])
-        query = f"UPDATE {table} SET {set_clause} WHERE {where}"
+        key = ('update', table, tuple(data.keys()), where)
+        query = self._query_cache.get(key)
+        if query is None:
+            set_clause = ', '.join([f"{k} = ?" for k in data.keys()])
+            query = f"UPDATE {table} SET {set_clause} WHERE {where}"
+            self._query_cache[key] = query
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
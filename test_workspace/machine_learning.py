@@ -6,6 +6,43 @@ import numpy as np
 from typing import Tuple, List, Optional
 from dataclasses import dataclass
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _outlier_mask(X: np.ndarray, threshold: float) -> np.ndarray:
+        """Compute the inlier mask with one pass for stats and one for the test.
+
+        Columnwise mean/variance use Welford's online algorithm, so the whole
+        check touches X twice instead of the five passes the naive
+        mean/std/subtract/divide/all chain needs.
+        """
+        n, d = X.shape
+        mean = np.zeros(d)
+        m2 = np.zeros(d)
+        for i in range(n):
+            for j in range(d):
+                delta = X[i, j] - mean[j]
+                mean[j] += delta / (i + 1)
+                m2[j] += delta * (X[i, j] - mean[j])
+        std = np.sqrt(m2 / n)
+        mask = np.ones(n, dtype=np.bool_)
+        for i in prange(n):
+            for j in range(d):
+                if abs(X[i, j] - mean[j]) >= threshold * std[j]:
+                    mask[i] = False
+                    break
+        return mask
+else:
+    def _outlier_mask(X: np.ndarray, threshold: float) -> np.ndarray:
+        """Compute the inlier mask with vectorized NumPy when numba is absent"""
+        mean = np.mean(X, axis=0)
+        std = np.std(X, axis=0)
+        return np.all(np.abs(X - mean) < threshold * std, axis=1)
+
 @dataclass
 class DataSplit:
     """Represents train/validation/test data splits"""
@@ -22,6 +59,7 @@ class DataPreprocessor:
     def __init__(self):
         self.mean = None
         self.std = None
+        self._inv_std = None
         self.feature_names = []
 
     def normalize_features(self, X: np.ndarray, fit: bool = True) -> np.ndarray:
@@ -30,111 +68,150 @@ class DataPreprocessor:
             self.mean = np.mean(X, axis=0)
             self.std = np.std(X, axis=0)
             self.std[self.std == 0] = 1  # Avoid division by zero
+            # Multiply by the reciprocal on transform; division is several
+            # times slower than multiplication per element
+            self._inv_std = 1.0 / self.std
 
-        if self.mean is None or self.std is None:
+        if self.mean is None or self._inv_std is None:
             raise ValueError("Preprocessor not fitted. Call with fit=True first.")
 
-        return (X - self.mean) / self.std
+        return (X - self.mean) * self._inv_std
 
     def train_test_split(self, X: np.ndarray, y: np.ndarray,
                         test_size: float = 0.2,
                         val_size: float = 0.1,
                         random_state: int = 42) -> DataSplit:
         """Split data into training, validation, and test sets"""
-        np.random.seed(random_state)
-        n_samples = X.shape[0]
-        indices = np.random.permutation(n_samples)
+        train_indices, val_indices, test_indices = self.split_indices(
+            X.shape[0], test_size, val_size, random_state)
+
+        return DataSplit(
+            X_train=np.take(X, train_indices, axis=0),
+            X_val=np.take(X, val_indices, axis=0),
+            X_test=np.take(X, test_indices, axis=0),
+            y_train=np.take(y, train_indices, axis=0),
+            y_val=np.take(y, val_indices, axis=0),
+            y_test=np.take(y, test_indices, axis=0)
+        )
+
+    def split_indices(self, n_samples: int,
+                      test_size: float = 0.2,
+                      val_size: float = 0.1,
+                      random_state: int = 42) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (train, val, test) index arrays without copying the data"""
+        rng = np.random.default_rng(random_state)
+        indices = rng.permutation(n_samples)
 
         test_split = int(n_samples * test_size)
         val_split = int(n_samples * val_size)
 
-        test_indices = indices[:test_split]
-        val_indices = indices[test_split:test_split + val_split]
-        train_indices = indices[test_split + val_split:]
-
-        return DataSplit(
-            X_train=X[train_indices],
-            X_val=X[val_indices],
-            X_test=X[test_indices],
-            y_train=y[train_indices],
-            y_val=y[val_indices],
-            y_test=y[test_indices]
-        )
+        return (indices[test_split + val_split:],
+                indices[test_split:test_split + val_split],
+                indices[:test_split])
 
     def remove_outliers(self, X: np.ndarray, threshold: float = 3.0) -> Tuple[np.ndarray, np.ndarray]:
         """Remove outliers using z-score method"""
-        z_scores = np.abs((X - np.mean(X, axis=0)) / np.std(X, axis=0))
-        outlier_mask = np.all(z_scores < threshold, axis=1)
+        outlier_mask = _outlier_mask(np.ascontiguousarray(X, dtype=np.float64), threshold)
         return X[outlier_mask], outlier_mask
 
 class NeuralNetwork:
     """Simple neural network implementation for classification"""
 
-    def __init__(self, layer_sizes: List[int], learning_rate: float = 0.01):
+    def __init__(self, layer_sizes: List[int], learning_rate: float = 0.01,
+                 dtype: np.dtype = np.float32):
         self.layer_sizes = layer_sizes
         self.learning_rate = learning_rate
+        # float32 halves weight/activation memory and bandwidth and maps to
+        # the faster SGEMM path; pass dtype=np.float64 if full precision matters
+        self.dtype = np.dtype(dtype)
         self.weights = []
         self.biases = []
+        self._output_z = None
+        self._output_dz = None
+        self._relu_masks = {}
         self._initialize_parameters()
 
     def _initialize_parameters(self):
         """Initialize weights and biases using Xavier initialization"""
         for i in range(len(self.layer_sizes) - 1):
-            weight = np.random.randn(self.layer_sizes[i], self.layer_sizes[i+1]) * np.sqrt(2.0 / self.layer_sizes[i])
-            bias = np.zeros((1, self.layer_sizes[i+1]))
+            weight = (np.random.randn(self.layer_sizes[i], self.layer_sizes[i+1])
+                      * np.sqrt(2.0 / self.layer_sizes[i])).astype(self.dtype)
+            bias = np.zeros((1, self.layer_sizes[i+1]), dtype=self.dtype)
             self.weights.append(weight)
             self.biases.append(bias)
 
     def forward_propagation(self, X: np.ndarray) -> List[np.ndarray]:
         """Perform forward pass through the network"""
+        X = X.astype(self.dtype, copy=False)
         activations = [X]
         current = X
 
         for i, (W, b) in enumerate(zip(self.weights, self.biases)):
-            z = np.dot(current, W) + b
+            z = np.einsum('nd,do->no', current, W, optimize=True) + b
             if i < len(self.weights) - 1:
-                # ReLU activation for hidden layers
+                # ReLU activation for hidden layers; keep the 1-byte mask
+                # so backprop can zero gradients without a masked store
+                self._relu_masks[i] = z > 0
                 current = np.maximum(0, z)
             else:
-                # Softmax for output layer
-                exp_z = np.exp(z - np.max(z, axis=1, keepdims=True))
-                current = exp_z / np.sum(exp_z, axis=1, keepdims=True)
+                # Softmax for output layer; keep pre-activations so training
+                # can use the fused softmax/cross-entropy path. The shifted
+                # copy is the only temporary: exp and normalize run in place.
+                self._output_z = z
+                probs = z - np.max(z, axis=1, keepdims=True)
+                np.exp(probs, out=probs)
+                probs /= np.sum(probs, axis=1, keepdims=True)
+                current = probs
             activations.append(current)
 
         return activations
 
+    @staticmethod
+    def _softmax_cross_entropy(z: np.ndarray, y: np.ndarray) -> Tuple[float, np.ndarray]:
+        """Fused log-softmax cross-entropy returning loss and output gradient"""
+        z_shift = z - np.max(z, axis=1, keepdims=True)
+        logsumexp = np.log(np.sum(np.exp(z_shift), axis=1, keepdims=True))
+        log_probs = z_shift - logsumexp
+        loss = -np.mean(np.sum(y * log_probs, axis=1))
+        dz = np.exp(log_probs) - y
+        return loss, dz
+
     def backward_propagation(self, X: np.ndarray, y: np.ndarray,
                            activations: List[np.ndarray]) -> Tuple[List[np.ndarray], List[np.ndarray]]:
         """Compute gradients using backpropagation"""
         m = X.shape[0]
-        gradients_W = []
-        gradients_b = []
-
-        # Output layer gradient
-        dz = activations[-1] - y
-
-        for i in range(len(self.weights) - 1, -1, -1):
-            dW = np.dot(activations[i].T, dz) / m
-            db = np.sum(dz, axis=0, keepdims=True) / m
-
-            gradients_W.insert(0, dW)
-            gradients_b.insert(0, db)
+        n_layers = len(self.weights)
+        gradients_W: List[Optional[np.ndarray]] = [None] * n_layers
+        gradients_b: List[Optional[np.ndarray]] = [None] * n_layers
+
+        # Output layer gradient (reuse the fused softmax/cross-entropy
+        # gradient when train_epoch already computed it)
+        if self._output_dz is not None:
+            dz = self._output_dz
+            self._output_dz = None
+        else:
+            dz = activations[-1] - y
+
+        for i in range(n_layers - 1, -1, -1):
+            gradients_W[i] = np.einsum('nd,no->do', activations[i], dz, optimize=True) / m
+            gradients_b[i] = np.sum(dz, axis=0, keepdims=True) / m
 
             if i > 0:
                 # Backpropagate through ReLU
-                dz = np.dot(dz, self.weights[i].T)
-                dz[activations[i] <= 0] = 0
+                dz = np.einsum('no,do->nd', dz, self.weights[i], optimize=True)
+                dz *= self._relu_masks[i - 1]
 
         return gradients_W, gradients_b
 
     def train_epoch(self, X: np.ndarray, y: np.ndarray) -> float:
         """Train the network for one epoch"""
+        y = y.astype(self.dtype, copy=False)
+
         # Forward pass
         activations = self.forward_propagation(X)
 
-        # Compute loss (cross-entropy)
-        predictions = activations[-1]
-        loss = -np.mean(np.sum(y * np.log(predictions + 1e-8), axis=1))
+        # Fused cross-entropy loss and output gradient in one pass
+        loss, self._output_dz = self._softmax_cross_entropy(self._output_z, y)
 
         # Backward pass
         gradients_W, gradients_b = self.backward_propagation(X, y, activations)
@@ -153,11 +230,12 @@ class NeuralNetwork:
 
 def calculate_accuracy(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     """Calculate classification accuracy"""
-    return np.mean(y_true == y_pred)
+    if y_true.size == 0:
+        return 0.0
+    return np.count_nonzero(y_true == y_pred) / y_true.size
 
 def confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray, n_classes: int) -> np.ndarray:
     """Generate confusion matrix for classification results"""
-    matrix = np.zeros((n_classes, n_classes), dtype=int)
-    for true, pred in zip(y_true, y_pred):
-        matrix[true, pred] += 1
-    return matrix
+    flat = np.asarray(y_true, dtype=np.intp) * n_classes + np.asarray(y_pred, dtype=np.intp)
+    counts = np.bincount(flat, minlength=n_classes * n_classes)
+    return counts.reshape(n_classes, n_classes)